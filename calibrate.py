@@ -26,7 +26,10 @@ Usage::
 """
 
 import argparse
+import functools
 import logging
+import platform
+import queue
 import sys
 import threading
 import time
@@ -38,18 +41,28 @@ import cv2
 import numpy as np
 import pyautogui
 
-from capture import capture_window, find_game_window, save_debug_screenshot
+from capture import (
+    capture_window,
+    close_capture,
+    ensure_debug_dir,
+    find_game_window,
+    save_debug_screenshot,
+)
 from config import (
+    CARD_COARSE_CONFIDENCE_MARGIN,
     DEBUG_DIR,
+    DEBUG_PNG_COMPRESSION,
     SCROLL_REGION_CENTER,
+    SCROLL_ROI,
     SCROLL_STEP,
     TEMPLATE_CARD,
     TEMPLATE_CONFIDENCE,
     TEMPLATE_DIR,
+    TEMPLATE_PATHS,
     TEMPLATE_WORLD_SCREEN,
 )
 from navigate import (
-    game_move_to,
+    game_scroll,
     navigate_home,
     navigate_to_afk_stages_ranking,
     navigate_to_arcane_labyrinth_ranking,
@@ -72,14 +85,83 @@ MODE_NAVIGATORS: dict[str, Callable[[], None]] = {
     "honor_duel": navigate_to_honor_duel_ranking,
 }
 
+# Frozen view of the valid mode names for O(1) membership checks in
+# argument validation.
+_MODE_SET: frozenset[str] = frozenset(MODE_NAVIGATORS)
+
 MAX_SCROLL_STEPS: int = 10
 
+# Thresholds as float32 scalars, matching the dtype of matchTemplate score
+# maps. Comparing against a Python float would also run in float32 — this
+# only skips the per-comparison scalar conversion.
+_CONFIDENCE_F32: np.float32 = np.float32(TEMPLATE_CONFIDENCE)
+_COARSE_CONFIDENCE_F32: np.float32 = np.float32(
+    TEMPLATE_CONFIDENCE - CARD_COARSE_CONFIDENCE_MARGIN
+)
+
 
 # ---------------------------------------------------------------------------
 # Capture subcommand
 # ---------------------------------------------------------------------------
 
 
+if platform.system() == "Windows":
+    import ctypes
+    import ctypes.wintypes
+
+    _user32 = ctypes.windll.user32
+    _cursor_point = ctypes.wintypes.POINT()
+
+    def _get_cursor_pos() -> tuple[int, int]:
+        """Read the cursor position with a direct Win32 ``GetCursorPos`` call.
+
+        Avoids pyautogui's wrapper layers on the 3 Hz tracking poll; the
+        POINT struct is preallocated once at module load.
+        """
+        _user32.GetCursorPos(ctypes.byref(_cursor_point))
+        return _cursor_point.x, _cursor_point.y
+else:
+
+    def _get_cursor_pos() -> tuple[int, int]:
+        """Read the cursor position via pyautogui (non-Windows fallback)."""
+        pos = pyautogui.position()
+        return pos[0], pos[1]
+
+
+def _wait_enter_or_timeout(timeout: float) -> bool:
+    """Wait up to *timeout* seconds for the user to press Enter.
+
+    Non-blocking stdin check so the caller can interleave other work (e.g.
+    printing the mouse position) in a single thread. Uses ``msvcrt`` on
+    Windows — ``select`` only supports sockets there — and ``select`` on
+    POSIX.
+
+    Args:
+        timeout: Seconds to wait before giving up.
+
+    Returns:
+        ``True`` if Enter was pressed (or stdin hit EOF), ``False`` on
+        timeout.
+    """
+    if platform.system() == "Windows":
+        import msvcrt
+
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if msvcrt.kbhit() and msvcrt.getwch() in ("\r", "\n"):
+                return True
+            time.sleep(0.02)
+        return False
+
+    import select
+
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if ready:
+        sys.stdin.readline()
+        return True
+    return False
+
+
 def _track_mouse() -> None:
     """Continuously print absolute and game-relative mouse position until Enter is pressed."""
     try:
@@ -90,26 +172,20 @@ def _track_mouse() -> None:
         print("  (game window not found — showing absolute only)")
 
     print("  Tracking mouse position (press Enter to stop)...")
-    stop = threading.Event()
-
-    def printer() -> None:
-        while not stop.is_set():
-            ax, ay = pyautogui.position()
+    last: tuple[int, int] = (-1, -1)
+    while True:
+        ax, ay = _get_cursor_pos()
+        # Only redraw when the cursor actually moved — an idle mouse would
+        # otherwise force a terminal flush every 300 ms for nothing.
+        if (ax, ay) != last:
+            last = (ax, ay)
             gx, gy = ax - off_x, ay - off_y
             print(
                 f"\r  Abs: ({ax:4d}, {ay:4d})  Game: ({gx:4d}, {gy:4d})  ",
                 end="", flush=True,
             )
-            stop.wait(0.3)
-
-    t = threading.Thread(target=printer, daemon=True)
-    t.start()
-    try:
-        input()
-    except EOFError:
-        pass
-    stop.set()
-    t.join(timeout=1.0)
+        if _wait_enter_or_timeout(0.3):
+            break
     print()
 
 
@@ -212,7 +288,7 @@ def _run_measure() -> None:
             print()
             continue
 
-        ax, ay = pyautogui.position()
+        ax, ay = _get_cursor_pos()
         gx, gy = ax - off_x, ay - off_y
         results.append((const_name, (gx, gy)))
         print(f"  {const_name} = ({gx}, {gy})  (abs: {ax}, {ay})")
@@ -232,12 +308,11 @@ def _run_measure() -> None:
         print(f"  {name} = {coords}")
 
     # Save to file
-    DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_debug_dir()
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     outfile = DEBUG_DIR / f"measurements_{timestamp}.txt"
-    with open(outfile, "w") as f:
-        for name, coords in results:
-            f.write(f"{name} = {coords}\n")
+    lines = [f"{name} = {coords}" for name, coords in results]
+    outfile.write_text("\n".join(lines) + "\n", encoding="utf-8")
     print(f"\n  Saved to: {outfile}")
     print()
 
@@ -284,7 +359,7 @@ def cmd_capture(_args: argparse.Namespace) -> None:
             break
 
         if not cmd:
-            ax, ay = pyautogui.position()
+            ax, ay = _get_cursor_pos()
             gx, gy = ax - off_x, ay - off_y
             print(f"  Abs: ({ax}, {ay})  Game: ({gx}, {gy})")
             continue
@@ -310,25 +385,29 @@ def cmd_capture(_args: argparse.Namespace) -> None:
 
         # Anything else is a label → capture screenshot with delay
         label = cmd.replace(" ", "_")
-        for i in range(3, 0, -1):
-            print(f"\r  Capturing in {i}...  ", end="", flush=True)
-            time.sleep(1)
-        print("\r  Capturing...        ", end="", flush=True)
+        # One flush + one sleep instead of three 1 s ticks — per-second
+        # redraws can block on slow terminals for no UX gain.
+        print("  Capturing in 3s — switch to the game window...", flush=True)
+        time.sleep(3)
         try:
             frame = capture_window()
         except RuntimeError as exc:
-            print(f"\r  Capture failed: {exc}")
+            print(f"  Capture failed: {exc}")
             continue
 
-        DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+        ensure_debug_dir()
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         filename = f"calibrate_{timestamp}_{label}.png"
         filepath = DEBUG_DIR / filename
-        cv2.imwrite(str(filepath), frame)
+        cv2.imwrite(
+            str(filepath), frame,
+            [cv2.IMWRITE_PNG_COMPRESSION, DEBUG_PNG_COMPRESSION],
+        )
         saved.append(filepath)
         print(f"  Saved: {filepath}")
 
     print(f"\n{len(saved)} screenshot(s) saved to {DEBUG_DIR}/")
+    close_capture()
 
 
 # ---------------------------------------------------------------------------
@@ -347,18 +426,19 @@ def cmd_template(args: argparse.Namespace) -> None:
         print(f"Error: source image not found: {source}")
         sys.exit(1)
 
+    x, y, w, h = args.x, args.y, args.w, args.h
+    if x < 0 or y < 0 or w <= 0 or h <= 0:
+        print("Error: invalid crop region — x, y must be >= 0 and w, h must be > 0")
+        sys.exit(1)
+
+    # Full-resolution decode is deliberate: templates must be pixel-exact
+    # crops of the screenshot, so reduced-decode flags are not an option.
     img = cv2.imread(str(source))
     if img is None:
         print(f"Error: could not read image: {source}")
         sys.exit(1)
 
-    x, y, w, h = args.x, args.y, args.w, args.h
     img_h, img_w = img.shape[:2]
-
-    if x < 0 or y < 0 or w <= 0 or h <= 0:
-        print("Error: invalid crop region — x, y must be >= 0 and w, h must be > 0")
-        sys.exit(1)
-
     if x + w > img_w or y + h > img_h:
         print(
             f"Error: crop region ({x}, {y}, {w}, {h}) exceeds image bounds "
@@ -380,74 +460,237 @@ def cmd_template(args: argparse.Namespace) -> None:
 # ---------------------------------------------------------------------------
 
 
-def detect_card_positions(frame: np.ndarray) -> list[int]:
-    """Detect card Y positions in *frame* via template matching.
-
-    Loads the card template from ``TEMPLATE_DIR / TEMPLATE_CARD`` and finds
-    all match locations above ``TEMPLATE_CONFIDENCE``.  Nearby Y values are
-    clustered (within template height) to avoid duplicates.
+@functools.lru_cache(maxsize=1)
+def _load_card_template() -> "np.ndarray | None":
+    """Load the card template once and cache it for all scroll steps.
 
-    Args:
-        frame: BGR screenshot to search.
+    ``detect_card_positions`` runs on every frame of every scroll step;
+    re-reading and re-decoding the PNG each time would dominate the cost of
+    the match itself. The missing-template warning is logged only on the
+    first (cached) failure.
 
     Returns:
-        Sorted list of unique card Y positions.  Empty if the card template
-        is missing or no matches are found.
+        The BGR template array, or ``None`` if the file is missing or
+        unreadable.
     """
-    card_path = str(TEMPLATE_DIR / TEMPLATE_CARD)
+    card_path = TEMPLATE_PATHS[TEMPLATE_CARD]
     card_template = cv2.imread(card_path)
     if card_template is None:
         logger.warning(
             "Card template not found at %s — skipping card detection", card_path
         )
+    return card_template
+
+
+@functools.lru_cache(maxsize=1)
+def _load_card_template_gray() -> "np.ndarray | None":
+    """Return the card template as single-channel grayscale.
+
+    Matching on grayscale moves a third of the bytes through matchTemplate
+    compared to BGR; the card chrome is high-contrast so luminance alone is
+    enough to localize it.
+    """
+    card_template = _load_card_template()
+    if card_template is None:
+        return None
+    return cv2.cvtColor(card_template, cv2.COLOR_BGR2GRAY)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_card_template_half() -> "np.ndarray | None":
+    """Return the grayscale card template downscaled by 2x for the coarse pass."""
+    card_template = _load_card_template_gray()
+    if card_template is None:
+        return None
+    return cv2.pyrDown(card_template)
+
+
+# OpenCV's transparent API offloads matchTemplate to OpenCL when inputs are
+# UMat — a real win on the gaming GPUs this tool typically runs next to.
+# Checked once; CPU path is used unchanged when no OpenCL device exists.
+_OPENCL_AVAILABLE: bool = cv2.ocl.haveOpenCL()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_card_template_half_umat() -> "cv2.UMat | None":
+    """Return the half-resolution template uploaded once as a ``cv2.UMat``."""
+    half_template = _load_card_template_half()
+    if half_template is None:
+        return None
+    return cv2.UMat(half_template)
+
+
+# Reused output buffer for the coarse matchTemplate pass (CPU path only —
+# the OpenCL path keeps its result on the device).
+_coarse_result_buf: "np.ndarray | None" = None
+
+
+def _coarse_candidate_rois(
+    gray: np.ndarray,
+    template_h: int,
+) -> list[tuple[int, int]]:
+    """Find candidate card bands via a half-resolution coarse match.
+
+    Matches the downscaled grayscale template against a ``cv2.pyrDown`` of
+    *gray* with a loosened threshold, clusters the hits, and expands each
+    cluster to a full-resolution ``(y_start, y_end)`` band of one template
+    height of margin. Overlapping bands are merged so the refinement pass
+    never re-scans the same rows. ``TM_CCORR_NORMED`` is used here — cheaper
+    than ``TM_CCOEFF_NORMED`` and good enough to propose candidates that the
+    full-resolution pass then confirms.
+
+    Args:
+        gray: Full-resolution grayscale screenshot.
+        template_h: Full-resolution template height in pixels.
+
+    Returns:
+        Merged, sorted list of ``(y_start, y_end)`` row bands to refine.
+    """
+    small = cv2.pyrDown(gray)
+    if _OPENCL_AVAILABLE:
+        coarse = cv2.matchTemplate(
+            cv2.UMat(small), _load_card_template_half_umat(), cv2.TM_CCORR_NORMED
+        ).get()
+    else:
+        # Frame and template geometry are fixed, so the score map shape never
+        # changes in practice — reuse one float32 buffer across scroll steps
+        # instead of allocating ~2 MB per call.
+        global _coarse_result_buf
+        half_tpl = _load_card_template_half()
+        out_shape = (
+            small.shape[0] - half_tpl.shape[0] + 1,
+            small.shape[1] - half_tpl.shape[1] + 1,
+        )
+        if _coarse_result_buf is None or _coarse_result_buf.shape != out_shape:
+            _coarse_result_buf = np.empty(out_shape, dtype=np.float32)
+        coarse = cv2.matchTemplate(
+            small, half_tpl, cv2.TM_CCORR_NORMED, _coarse_result_buf
+        )
+    # Only the row coordinate matters for banding, so collapse the score map
+    # to a per-row maximum (SIMD inside OpenCV) instead of materializing
+    # every (y, x) hit with np.where. flatnonzero rows are already sorted
+    # and unique.
+    coarse_row_max = cv2.reduce(coarse, 1, cv2.REDUCE_MAX).ravel()
+    coarse_ys = np.flatnonzero(coarse_row_max >= _COARSE_CONFIDENCE_F32)
+    if coarse_ys.size == 0:
         return []
 
-    result = cv2.matchTemplate(frame, card_template, cv2.TM_CCOEFF_NORMED)
-    locations = np.where(result >= TEMPLATE_CONFIDENCE)
-    y_values = sorted(set(locations[0].tolist()))
+    frame_h = gray.shape[0]
+    bands: list[tuple[int, int]] = []
+    for y_half in coarse_ys.tolist():
+        y_full = y_half * 2
+        start = max(0, y_full - template_h)
+        end = min(frame_h, y_full + 2 * template_h)
+        if bands and start <= bands[-1][1]:
+            bands[-1] = (bands[-1][0], max(bands[-1][1], end))
+        else:
+            bands.append((start, end))
+    return bands
+
 
-    if not y_values:
-        logger.info("No card positions detected above confidence %.2f", TEMPLATE_CONFIDENCE)
+def _cluster_card_ys(y_values: np.ndarray, template_h: int) -> list[int]:
+    """Collapse sorted match rows into one mean Y per card.
+
+    Pure-NumPy single-pass kernel: cluster boundaries are the gaps of at
+    least *template_h* between consecutive values.
+
+    Args:
+        y_values: Sorted, unique match row coordinates.
+        template_h: Card template height in pixels.
+
+    Returns:
+        One integer mean Y per cluster, in ascending order.
+    """
+    breaks = np.nonzero(np.diff(y_values) >= template_h)[0] + 1
+    return [int(cluster.mean()) for cluster in np.split(y_values, breaks)]
+
+
+def detect_card_positions(frame: np.ndarray) -> list[int]:
+    """Detect card Y positions in *frame* via coarse-to-fine template matching.
+
+    Searches only the ``config.SCROLL_ROI`` list area, converted to
+    grayscale once per call. Runs a half-resolution ``matchTemplate`` pass
+    with a loosened threshold to find candidate bands,
+    then refines only those bands at full resolution against the cached
+    grayscale card template from ``TEMPLATE_DIR / TEMPLATE_CARD``.  Nearby Y
+    values are clustered (within template height) to avoid duplicates.
+
+    Args:
+        frame: BGR screenshot to search.
+
+    Returns:
+        Sorted list of unique card Y positions.  Empty if the card template
+        is missing or no matches are found.
+    """
+    card_template = _load_card_template_gray()
+    if card_template is None:
         return []
 
-    # Cluster nearby Y values (within one template height)
+    # Cards only ever appear inside the scrollable list area; everything
+    # outside SCROLL_ROI is noise the match would pay to scan.
+    roi_x0, roi_y0, roi_x1, roi_y1 = SCROLL_ROI
+    gray = cv2.cvtColor(frame[roi_y0:roi_y1, roi_x0:roi_x1], cv2.COLOR_BGR2GRAY)
     template_h = card_template.shape[0]
-    clusters: list[list[int]] = [[y_values[0]]]
-    for y in y_values[1:]:
-        if y - clusters[-1][0] < template_h:
-            clusters[-1].append(y)
-        else:
-            clusters.append([y])
+    hit_arrays: list[np.ndarray] = []
+    for y_start, y_end in _coarse_candidate_rois(gray, template_h):
+        roi = gray[y_start:y_end]
+        if roi.shape[0] < template_h:
+            continue
+        result = cv2.matchTemplate(roi, card_template, cv2.TM_CCOEFF_NORMED)
+        row_max = cv2.reduce(result, 1, cv2.REDUCE_MAX).ravel()
+        rows = np.flatnonzero(row_max >= _CONFIDENCE_F32)
+        if rows.size:
+            hit_arrays.append(rows + y_start)
+
+    y_values = (
+        np.unique(np.concatenate(hit_arrays)) if hit_arrays else np.empty(0, int)
+    )
+    if y_values.size == 0:
+        logger.info("No card positions detected above confidence %.2f", TEMPLATE_CONFIDENCE)
+        return []
 
-    positions = [int(np.mean(c)) for c in clusters]
+    # Shift ROI-relative cluster means back to frame coordinates.
+    positions = [y + roi_y0 for y in _cluster_card_ys(y_values, template_h)]
     logger.info("Detected %d card(s) at Y positions: %s", len(positions), positions)
     return positions
 
 
-def draw_card_rectangles(
+def draw_card_rectangles_inplace(
     frame: np.ndarray,
     y_positions: list[int],
     card_height: int = 120,
 ) -> np.ndarray:
-    """Draw labelled rectangles at each card Y position on a copy of *frame*.
+    """Draw labelled rectangles at each card Y position directly on *frame*.
+
+    Annotates in place — the calibration loop is the only consumer of the
+    frame after detection, so copying ~6 MB per scroll step bought nothing.
+    Callers that need the original must pass ``frame.copy()`` themselves.
 
     Args:
-        frame: BGR image to annotate.
+        frame: BGR image to annotate (mutated).
         y_positions: Y coordinates of detected cards.
         card_height: Approximate card height in pixels for rectangle sizing.
 
     Returns:
-        Annotated copy of *frame*.
+        The same *frame* array, annotated.
     """
-    annotated = frame.copy()
+    annotated = frame
+    if not y_positions:
+        return annotated
+
+    # One polylines call draws every rectangle in a single trip into OpenCV
+    # instead of one cv2.rectangle call per card.
+    right = frame.shape[1] - 50
+    rects = np.array(
+        [
+            [[50, y], [right, y], [right, y + card_height], [50, y + card_height]]
+            for y in y_positions
+        ],
+        dtype=np.int32,
+    )
+    cv2.polylines(annotated, rects, isClosed=True, color=(0, 0, 255), thickness=2)
+
     for i, y in enumerate(y_positions):
-        cv2.rectangle(
-            annotated,
-            (50, y),
-            (frame.shape[1] - 50, y + card_height),
-            (0, 0, 255),
-            2,
-        )
         cv2.putText(
             annotated,
             f"Card {i} (y={y})",
@@ -460,27 +703,75 @@ def draw_card_rectangles(
     return annotated
 
 
+# Pending calibration frames handed off to the background writer thread.
+_frame_write_queue: "queue.Queue[tuple[np.ndarray, Path]]" = queue.Queue()
+_writer_thread: "threading.Thread | None" = None
+
+
+def _frame_writer() -> None:
+    """Drain the frame queue, encoding and writing PNGs off the scroll loop.
+
+    ``task_done()`` is called in a ``finally`` so that a failed write can
+    never leave ``calibrate_mode``'s ``join()`` blocked forever.
+    """
+    while True:
+        frame, filepath = _frame_write_queue.get()
+        try:
+            ok = cv2.imwrite(
+                str(filepath), frame,
+                [cv2.IMWRITE_PNG_COMPRESSION, DEBUG_PNG_COMPRESSION],
+            )
+            if ok:
+                logger.info("Saved calibration frame: %s", filepath)
+            else:
+                logger.error(
+                    "Failed to save calibration frame: expected imwrite to "
+                    "succeed for %s, but it returned False", filepath,
+                )
+        except Exception:
+            logger.exception("Failed to save calibration frame: %s", filepath)
+        finally:
+            _frame_write_queue.task_done()
+
+
+def _ensure_writer_thread() -> None:
+    """Start the daemon writer thread if it is not already running."""
+    global _writer_thread
+    if _writer_thread is None or not _writer_thread.is_alive():
+        _writer_thread = threading.Thread(target=_frame_writer, daemon=True)
+        _writer_thread.start()
+
+
 def save_calibration_frame(
     frame: np.ndarray,
     mode: str,
     step: int,
+    run_ts: str,
 ) -> Path:
-    """Write an annotated calibration frame to ``DEBUG_DIR``.
+    """Queue an annotated calibration frame for writing to ``DEBUG_DIR``.
+
+    PNG encoding of a full 1920x1080 frame takes tens of milliseconds, so
+    the write happens on a background thread and this function returns
+    immediately. Ownership of *frame* transfers to the writer — callers must
+    not mutate it afterwards. ``calibrate_mode`` drains the queue before
+    navigating home.
 
     Args:
         frame: BGR image to save.
         mode: Mode name for the filename.
         step: Scroll step number.
+        run_ts: UTC timestamp string shared by all steps of one calibration
+            run — the step counter disambiguates files, so frames of a run
+            sort together under one timestamp.
 
     Returns:
-        Path to the saved PNG file.
+        Path the PNG will be written to.
     """
-    DEBUG_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    filename = f"calibrate_{timestamp}_{mode}_step{step:02d}.png"
+    ensure_debug_dir()
+    filename = f"calibrate_{run_ts}_{mode}_step{step:02d}.png"
     filepath = DEBUG_DIR / filename
-    cv2.imwrite(str(filepath), frame)
-    logger.info("Saved calibration frame: %s", filepath)
+    _ensure_writer_thread()
+    _frame_write_queue.put((frame, filepath))
     return filepath
 
 
@@ -508,6 +799,11 @@ def calibrate_mode(mode: str, max_steps: int = MAX_SCROLL_STEPS) -> None:
     navigator = MODE_NAVIGATORS[mode]
     navigator()
 
+    run_ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    prev_sample: "np.ndarray | None" = None
+    # Bind loop constants locally — skips the module-global lookup per step.
+    scroll_x, scroll_y = SCROLL_REGION_CENTER
+    scroll_step = SCROLL_STEP
     for step in range(max_steps):
         logger.info("--- Scroll step %d/%d ---", step, max_steps - 1)
 
@@ -517,17 +813,27 @@ def calibrate_mode(mode: str, max_steps: int = MAX_SCROLL_STEPS) -> None:
             logger.error("Frame stability not reached at step %d, stopping", step)
             break
 
-        y_positions = detect_card_positions(frame)
-        annotated = draw_card_rectangles(frame, y_positions)
-        save_calibration_frame(annotated, mode, step)
+        # Near the bottom of a list the scroll springs back and successive
+        # steps settle on an identical frame; a 16x-strided sample (~8 KB)
+        # is enough to spot that and skip the matchTemplate + PNG dump.
+        # Copied because annotation below mutates the frame in place.
+        sample = frame[::16, ::16].copy()
+        if prev_sample is not None and np.array_equal(sample, prev_sample):
+            logger.info("Frame unchanged since previous step — skipping detection")
+        else:
+            y_positions = detect_card_positions(frame)
+            annotated = draw_card_rectangles_inplace(frame, y_positions)
+            save_calibration_frame(annotated, mode, step, run_ts)
+        prev_sample = sample
 
         # Scroll down
-        game_move_to(*SCROLL_REGION_CENTER)
-        pyautogui.scroll(-SCROLL_STEP)
+        game_scroll(scroll_x, scroll_y, -scroll_step)
         logger.debug(
-            "Scrolled down %d px at (%d, %d)", SCROLL_STEP, *SCROLL_REGION_CENTER
+            "Scrolled down %d px at (%d, %d)", scroll_step, scroll_x, scroll_y
         )
 
+    # Let the background writer finish before leaving this mode's screen.
+    _frame_write_queue.join()
     navigate_home()
     logger.info("Finished calibrating %s", mode)
 
@@ -535,7 +841,7 @@ def calibrate_mode(mode: str, max_steps: int = MAX_SCROLL_STEPS) -> None:
 def cmd_scroll(args: argparse.Namespace) -> None:
     """Navigate to each mode, scroll through rankings, and dump annotated frames."""
     # Verify world screen before any navigation
-    world_template = str(TEMPLATE_DIR / TEMPLATE_WORLD_SCREEN)
+    world_template = TEMPLATE_PATHS[TEMPLATE_WORLD_SCREEN]
     logger.info("Checking for World screen...")
     try:
         wait_for_screen(world_template, timeout=5.0)
@@ -662,7 +968,7 @@ def main() -> None:
             format="%(asctime)s %(levelname)-8s %(name)s: %(message)s",
         )
         for mode in args.modes:
-            if mode not in MODE_NAVIGATORS:
+            if mode not in _MODE_SET:
                 scroll_parser.error(
                     f"Unknown mode '{mode}'. "
                     f"Choose from: {', '.join(MODE_NAVIGATORS.keys())}"
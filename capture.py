@@ -5,9 +5,11 @@ operations go through this module — no other module should import ``mss``
 directly.
 """
 
+import atexit
 import logging
 import platform
 import subprocess
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -17,13 +19,72 @@ import numpy as np
 
 from config import (
     DEBUG_DIR,
+    DEBUG_PNG_COMPRESSION,
     GAME_HEIGHT,
     GAME_PROCESS_NAME,
     GAME_WIDTH,
+    WINDOW_CACHE_TTL,
 )
 
 logger = logging.getLogger(__name__)
 
+# Persistent mss instance, created lazily on first capture. Constructing
+# mss.mss() per call re-initializes the display connection each time, which
+# dominates capture latency in tight poll loops.
+_sct: "mss.base.MSSBase | None" = None
+
+
+def _get_sct() -> "mss.base.MSSBase":
+    """Return the shared ``mss`` instance, creating it on first use."""
+    global _sct
+    if _sct is None:
+        _sct = mss.mss()
+    return _sct
+
+
+# Cached window geometry as (monotonic timestamp, geometry dict). Window
+# enumeration (EnumWindows / pgrep) is far slower than the grab itself, so
+# steady-state captures reuse the last result for WINDOW_CACHE_TTL seconds.
+_window_cache: "tuple[float, dict[str, int]] | None" = None
+
+# Reusable BGR destination for capture_window(). Converting into a
+# preallocated buffer avoids a fresh 6 MB allocation per frame; callers that
+# need to retain the frame across captures must request a copy.
+_frame_buf: np.ndarray = np.empty((GAME_HEIGHT, GAME_WIDTH, 3), dtype=np.uint8)
+
+# Expected shape of the raw BGRA grab; validated before the BGR conversion
+# so a bad frame never pays for the channel drop.
+_EXPECTED_BGRA_SHAPE: tuple[int, int, int] = (GAME_HEIGHT, GAME_WIDTH, 4)
+
+
+def close_capture() -> None:
+    """Release the shared ``mss`` instance.
+
+    Safe to call when no capture has happened yet. Long-running interactive
+    tools (e.g. the calibration CLI) should call this on exit.
+    """
+    global _sct
+    if _sct is not None:
+        _sct.close()
+        _sct = None
+
+
+# Make sure the display connection is released even when callers abort
+# without reaching their own cleanup.
+atexit.register(close_capture)
+
+# Whether DEBUG_DIR is known to exist — the mkdir stat is skipped after the
+# first save.
+_debug_dir_ready: bool = False
+
+
+def ensure_debug_dir() -> None:
+    """Create ``DEBUG_DIR`` on first call; subsequent calls are no-ops."""
+    global _debug_dir_ready
+    if not _debug_dir_ready:
+        DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+        _debug_dir_ready = True
+
 
 def _find_window_rect_windows() -> dict[str, int]:
     """Find the AFK Journey client area rectangle using the Windows API.
@@ -45,38 +106,44 @@ def _find_window_rect_windows() -> dict[str, int]:
 
     user32 = ctypes.windll.user32
 
-    # Storage for the result found by the callback
-    found: list[int] = []  # will hold [hwnd] if found
-
-    # EnumWindows callback type
-    WNDENUMPROC = ctypes.WINFUNCTYPE(
-        ctypes.wintypes.BOOL,
-        ctypes.wintypes.HWND,
-        ctypes.wintypes.LPARAM,
-    )
+    # Fast path: an exact-title match is a single call with no Python
+    # callback trampoline. The client titles its window with the plain
+    # process name, so this usually succeeds immediately.
+    hwnd = user32.FindWindowW(None, GAME_PROCESS_NAME)
+
+    if not hwnd:
+        # Fallback: enumerate top-level windows for a case-insensitive
+        # substring match. One shared title buffer; hoist the lowercased
+        # needle out of the per-window callback.
+        found: list[int] = []  # will hold [hwnd] if found
+        needle = GAME_PROCESS_NAME.lower()
+        buf = ctypes.create_unicode_buffer(256)
+
+        WNDENUMPROC = ctypes.WINFUNCTYPE(
+            ctypes.wintypes.BOOL,
+            ctypes.wintypes.HWND,
+            ctypes.wintypes.LPARAM,
+        )
 
-    def enum_callback(hwnd: int, _lparam: int) -> bool:
-        if not user32.IsWindowVisible(hwnd):
-            return True  # continue enumeration
-        length = user32.GetWindowTextLengthW(hwnd)
-        if length == 0:
+        def enum_callback(hwnd: int, _lparam: int) -> bool:
+            if not user32.IsWindowVisible(hwnd):
+                return True  # continue enumeration
+            if user32.GetWindowTextW(hwnd, buf, 256) == 0:
+                return True
+            if needle in buf.value.lower():
+                found.append(hwnd)
+                return False  # stop enumeration
             return True
-        buf = ctypes.create_unicode_buffer(length + 1)
-        user32.GetWindowTextW(hwnd, buf, length + 1)
-        if GAME_PROCESS_NAME.lower() in buf.value.lower():
-            found.append(hwnd)
-            return False  # stop enumeration
-        return True
 
-    user32.EnumWindows(WNDENUMPROC(enum_callback), 0)
+        user32.EnumWindows(WNDENUMPROC(enum_callback), 0)
 
-    if not found:
-        raise RuntimeError(
-            f"Game window not found: no visible window with title containing "
-            f"'{GAME_PROCESS_NAME}'"
-        )
+        if not found:
+            raise RuntimeError(
+                f"Game window not found: no visible window with title "
+                f"containing '{GAME_PROCESS_NAME}'"
+            )
 
-    hwnd = found[0]
+        hwnd = found[0]
 
     # Get client area dimensions
     rect = ctypes.wintypes.RECT()
@@ -115,6 +182,10 @@ def find_game_window() -> dict[str, int]:
     back to a subprocess ``pgrep`` check with hardcoded geometry (the game
     only runs on Windows; Linux path exists for development convenience).
 
+    The resolved geometry is cached for ``WINDOW_CACHE_TTL`` seconds so
+    tight capture loops skip process/window enumeration; the cache is
+    invalidated when a capture comes back with unexpected dimensions.
+
     Returns:
         A dict with keys ``"left"``, ``"top"``, ``"width"``, ``"height"``
         describing the client area in screen coordinates.
@@ -123,36 +194,75 @@ def find_game_window() -> dict[str, int]:
         RuntimeError: If the game window cannot be found, or client area
             dimensions do not match ``GAME_WIDTH x GAME_HEIGHT``.
     """
-    system = platform.system()
+    global _window_cache
+
+    if _window_cache is not None:
+        cached_at, geometry = _window_cache
+        if time.monotonic() - cached_at < WINDOW_CACHE_TTL:
+            return geometry
+
+    if platform.system() == "Windows":
+        geometry = _find_window_rect_windows()
+    else:
+        # Linux fallback — process check only (hardcoded geometry)
+        result = subprocess.run(
+            ["pgrep", "-fi", GAME_PROCESS_NAME],
+            capture_output=True, text=True, check=False,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Game window not found: expected process '{GAME_PROCESS_NAME}' "
+                f"to be running, but it was not detected"
+            )
 
-    if system == "Windows":
-        return _find_window_rect_windows()
+        logger.info("Found game process: %s", GAME_PROCESS_NAME)
+        geometry = {
+            "left": 0,
+            "top": 0,
+            "width": GAME_WIDTH,
+            "height": GAME_HEIGHT,
+        }
 
-    # Linux fallback — process check only (hardcoded geometry)
-    result = subprocess.run(
-        ["pgrep", "-fi", GAME_PROCESS_NAME],
-        capture_output=True, text=True, check=False,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"Game window not found: expected process '{GAME_PROCESS_NAME}' "
-            f"to be running, but it was not detected"
-        )
+    _window_cache = (time.monotonic(), geometry)
+    return geometry
 
-    logger.info("Found game process: %s", GAME_PROCESS_NAME)
-    return {
-        "left": 0,
-        "top": 0,
-        "width": GAME_WIDTH,
-        "height": GAME_HEIGHT,
-    }
+
+def _invalidate_window_cache() -> None:
+    """Drop the cached window geometry so the next lookup re-resolves."""
+    global _window_cache
+    _window_cache = None
+
+
+def _grab_bgr(geometry: dict[str, int]) -> np.ndarray:
+    """Grab an arbitrary region and return a freshly allocated BGR array.
+
+    Bare capture primitive with no window discovery or size check — used
+    for regions that are not the fixed game window (e.g. the full-monitor
+    debug fallback), where the shared frame buffer does not apply.
+
+    Args:
+        geometry: Region dict with ``"left"``, ``"top"``, ``"width"``,
+            ``"height"`` keys, as accepted by ``mss.grab``.
+
+    Returns:
+        A BGR numpy array sized to the requested region.
+    """
+    bgra = np.asarray(_get_sct().grab(geometry))
+    return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
 
 
-def capture_window() -> np.ndarray:
+def capture_window(copy: bool = True) -> np.ndarray:
     """Capture the game window as a BGR numpy array.
 
     The returned image is always ``GAME_WIDTH x GAME_HEIGHT`` regardless of
-    actual window position on the desktop.
+    actual window position on the desktop. The BGRA→BGR conversion writes
+    into a shared preallocated buffer so the hot capture path allocates
+    nothing; a zero-copy view of the mss raw buffer feeds the conversion.
+
+    Args:
+        copy: If True (default), return an independent copy the caller owns.
+            If False, return the shared internal buffer — valid only until
+            the next capture. Use for poll loops that never retain a frame.
 
     Returns:
         A numpy array of shape ``(GAME_HEIGHT, GAME_WIDTH, 3)`` in BGR
@@ -163,20 +273,26 @@ def capture_window() -> np.ndarray:
     """
     geometry = find_game_window()
 
-    with mss.mss() as sct:
-        screenshot = sct.grab(geometry)
+    # Zero-copy view of the BGRA capture buffer (no allocation).
+    bgra = np.asarray(_get_sct().grab(geometry))
 
-    # mss returns BGRA; drop alpha channel for OpenCV-compatible BGR.
-    frame = np.array(screenshot)[:, :, :3]
+    if bgra.shape != _EXPECTED_BGRA_SHAPE:
+        # The cached geometry may be stale (window moved or resized) —
+        # re-resolve once before treating the mismatch as fatal.
+        _invalidate_window_cache()
+        geometry = find_game_window()
+        bgra = np.asarray(_get_sct().grab(geometry))
+        if bgra.shape != _EXPECTED_BGRA_SHAPE:
+            raise RuntimeError(
+                f"Unexpected capture dimensions: expected "
+                f"{_EXPECTED_BGRA_SHAPE}, got {bgra.shape}"
+            )
 
-    if frame.shape != (GAME_HEIGHT, GAME_WIDTH, 3):
-        raise RuntimeError(
-            f"Unexpected capture dimensions: expected "
-            f"({GAME_HEIGHT}, {GAME_WIDTH}, 3), got {frame.shape}"
-        )
+    # Drop alpha via OpenCV's SIMD channel-drop kernel into the shared buffer.
+    cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=_frame_buf)
 
-    logger.debug("Captured frame: shape=%s", frame.shape)
-    return frame
+    logger.debug("Captured frame: shape=%s", _frame_buf.shape)
+    return _frame_buf.copy() if copy else _frame_buf
 
 
 def save_debug_screenshot(context: str) -> Path:
@@ -193,7 +309,7 @@ def save_debug_screenshot(context: str) -> Path:
     Returns:
         The path to the saved PNG file.
     """
-    DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_debug_dir()
 
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     filename = f"{timestamp}_{context}.png"
@@ -206,10 +322,14 @@ def save_debug_screenshot(context: str) -> Path:
             "Game window unavailable for debug screenshot; "
             "falling back to primary monitor capture"
         )
-        with mss.mss() as sct:
-            screenshot = sct.grab(sct.monitors[1])
-        frame = np.array(screenshot)[:, :, :3]
-
-    cv2.imwrite(str(filepath), frame)
+        # Skip window discovery entirely — grab the primary monitor.
+        frame = _grab_bgr(_get_sct().monitors[1])
+
+    # Level-1 PNG: debug frames are throwaway diagnostics, so the cheapest
+    # DEFLATE setting keeps the abort path fast.
+    cv2.imwrite(
+        str(filepath), frame,
+        [cv2.IMWRITE_PNG_COMPRESSION, DEBUG_PNG_COMPRESSION],
+    )
     logger.info("Debug screenshot saved: %s", filepath)
     return filepath
@@ -61,6 +61,11 @@ COLUMN_ORDER: Final[list[str]] = [
 # Matches against tasklist (Windows) or pgrep (Linux).
 GAME_PROCESS_NAME: Final[str] = "AFK Journey"
 
+# How long (seconds) a resolved window geometry stays cached before
+# find_game_window() re-enumerates windows/processes. Window enumeration
+# costs tens of ms — far more than the capture itself.
+WINDOW_CACHE_TTL: Final[float] = 2.0
+
 GAME_WIDTH: Final[int] = 1920
 GAME_HEIGHT: Final[int] = 1080
 
@@ -72,6 +77,15 @@ TEMPLATE_CONFIDENCE: Final[float] = 0.85
 WAIT_TIMEOUT: Final[float] = 10.0
 POLL_INTERVAL: Final[float] = 0.2
 
+# Margins subtracted from the confidence threshold on half-resolution coarse
+# matching passes — pyrDown blurs fine detail, so true matches score slightly
+# lower there. Navigation waits use the more generous margin: a coarse miss
+# in wait_for_screen lets the poll time out, which is fatal. Card detection
+# in the calibration tool can afford the tighter margin because its coarse
+# hits are always re-checked at full resolution within the same frame.
+COARSE_CONFIDENCE_MARGIN: Final[float] = 0.1
+CARD_COARSE_CONFIDENCE_MARGIN: Final[float] = 0.05
+
 # ---------------------------------------------------------------------------
 # Frame stability (used after scrolling)
 # ---------------------------------------------------------------------------
@@ -81,6 +95,12 @@ POLL_INTERVAL: Final[float] = 0.2
 # comfortable margin above noise while catching any real change.
 STABILITY_THRESHOLD: Final[float] = 2.0
 
+# Row/column stride for sub-sampling frames in the stability check. Any UI
+# change large enough to matter (cards sliding, lists settling) moves far
+# more than one pixel in 64, so comparing every 8th row and column gives a
+# statistically equivalent mean at 1/64 of the memory traffic.
+STABILITY_SAMPLE_STRIDE: Final[int] = 8
+
 # ---------------------------------------------------------------------------
 # Scrolling
 # ---------------------------------------------------------------------------
@@ -129,14 +149,25 @@ FUZZY_MATCH_THRESHOLD: Final[float] = 0.85
 # HSV range for the green "Cleared" text.
 # Measured from 2974 pixels across 4 Cleared cards (unobstructed captures):
 #   H 32-60, S 15-117, V 153-230.  Margins added for robustness.
-CLEARED_HSV_LOWER: Final[np.ndarray] = np.array([28, 10, 140])
-CLEARED_HSV_UPPER: Final[np.ndarray] = np.array([65, 130, 240])
+# dtype uint8 to match the HSV image — cv2.inRange would otherwise cast
+# the default int64 bounds on every call.
+CLEARED_HSV_LOWER: Final[np.ndarray] = np.array([28, 10, 140], dtype=np.uint8)
+CLEARED_HSV_UPPER: Final[np.ndarray] = np.array([65, 130, 240], dtype=np.uint8)
 
 # Minimum number of green pixels to classify a card as Cleared.
 # Live measurement found ~740 green pixels per Cleared card;
 # 50 is a safe minimum to distinguish from noise.
 CLEARED_PIXEL_THRESHOLD: Final[int] = 50
 
+# ---------------------------------------------------------------------------
+# Debug output
+# ---------------------------------------------------------------------------
+
+# PNG compression level (0-9) for debug/calibration frame dumps. Level 1 is
+# the cheapest DEFLATE setting — these are throwaway diagnostic frames, so
+# encode speed matters more than file size.
+DEBUG_PNG_COMPRESSION: Final[int] = 1
+
 # ---------------------------------------------------------------------------
 # Data values
 # ---------------------------------------------------------------------------
@@ -199,6 +230,11 @@ CLICK_BACK: Final[tuple[int, int]] = (0, 0)
 
 SCROLL_REGION_CENTER: Final[tuple[int, int]] = (960, 540)  # TODO(M3): refine
 
+# Bounding box of the scrollable list area as (x0, y0, x1, y1). Card
+# detection only searches inside this region — cards never appear outside
+# the list. Defaults to the full frame until measured.  # TODO(M3): tighten
+SCROLL_ROI: Final[tuple[int, int, int, int]] = (0, 0, GAME_WIDTH, GAME_HEIGHT)
+
 # ---------------------------------------------------------------------------
 # Template file names (inside TEMPLATE_DIR)
 # ---------------------------------------------------------------------------
@@ -211,6 +247,36 @@ TEMPLATE_MODE_SCREEN: Final[str] = "mode_screen.png"
 TEMPLATE_RANKING_SCREEN: Final[str] = "ranking_screen.png"
 TEMPLATE_CARD: Final[str] = "card.png"
 
+# Absolute template path strings, resolved once at import. Navigation waits
+# run several times per transition — no reason to rebuild Path objects and
+# re-stringify them at every call site.
+TEMPLATE_PATHS: Final[dict[str, str]] = {
+    name: str(TEMPLATE_DIR / name)
+    for name in (
+        TEMPLATE_WORLD_SCREEN,
+        TEMPLATE_GUILD_HALL,
+        TEMPLATE_GUILD_MEMBER_LIST,
+        TEMPLATE_BATTLE_MODES,
+        TEMPLATE_MODE_SCREEN,
+        TEMPLATE_RANKING_SCREEN,
+        TEMPLATE_CARD,
+    )
+}
+
+# Expected on-screen region per screen template as (x, y, w, h).
+# wait_for_screen() restricts matching to this region — each template
+# element sits at a fixed UI position, so searching the rest of the frame
+# is wasted work. Full-frame until measured.  # TODO(M3): tighten from
+# M2 screenshots
+TEMPLATE_ROIS: Final[dict[str, tuple[int, int, int, int]]] = {
+    TEMPLATE_WORLD_SCREEN: (0, 0, GAME_WIDTH, GAME_HEIGHT),
+    TEMPLATE_GUILD_HALL: (0, 0, GAME_WIDTH, GAME_HEIGHT),
+    TEMPLATE_GUILD_MEMBER_LIST: (0, 0, GAME_WIDTH, GAME_HEIGHT),
+    TEMPLATE_BATTLE_MODES: (0, 0, GAME_WIDTH, GAME_HEIGHT),
+    TEMPLATE_MODE_SCREEN: (0, 0, GAME_WIDTH, GAME_HEIGHT),
+    TEMPLATE_RANKING_SCREEN: (0, 0, GAME_WIDTH, GAME_HEIGHT),
+}
+
 # ---------------------------------------------------------------------------
 # Card OCR crop regions — (x_offset, y_offset, width, height)
 # Offsets are relative to the detected card Y position.
@@ -10,6 +10,7 @@ screen capture to ``capture.py``.
 
 import logging
 import time
+from pathlib import Path
 
 import cv2
 import numpy as np
@@ -41,28 +42,80 @@ from config import (
     CLICK_RANKING_HONOR_DUEL,
     CLICK_RANKING_SUPREME_ARENA,
     CLICK_SUPREME_ARENA,
+    COARSE_CONFIDENCE_MARGIN,
     FRAME_STABILITY_TIMEOUT,
     NAV_HOME_CHECK_TIMEOUT,
     NAV_HOME_MAX_CLICKS,
     POLL_INTERVAL,
+    STABILITY_SAMPLE_STRIDE,
     STABILITY_THRESHOLD,
     TEMPLATE_BATTLE_MODES,
-    TEMPLATE_DIR,
     TEMPLATE_GUILD_HALL,
     TEMPLATE_GUILD_MEMBER_LIST,
     TEMPLATE_MODE_SCREEN,
+    TEMPLATE_PATHS,
     TEMPLATE_RANKING_SCREEN,
+    TEMPLATE_ROIS,
     TEMPLATE_WORLD_SCREEN,
 )
 
 logger = logging.getLogger(__name__)
 
+# Decoded template images keyed by path, as grayscale (full, half-resolution)
+# pairs. wait_for_screen polls several times per second, so the PNG decode,
+# cvtColor, and pyrDown must not repeat per call. UI-chrome templates carry
+# no colour signal, and single-channel correlation is a third of the work.
+_template_cache: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+# Reusable cv2.matchTemplate score buffers keyed by result shape — the map
+# for a 1080p screenshot is ~8 MB of float32, too much to reallocate per poll.
+_match_result_cache: dict[tuple[int, int], np.ndarray] = {}
+
+
+def _load_template(template_path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Load a template image, caching grayscale full/half-resolution variants.
+
+    Args:
+        template_path: Path to the reference PNG template.
+
+    Returns:
+        A ``(template, template_half)`` pair — the grayscale template and
+        its ``cv2.pyrDown`` half-resolution version for the coarse pass.
+
+    Raises:
+        FileNotFoundError: If the template image cannot be loaded.
+    """
+    cached = _template_cache.get(template_path)
+    if cached is None:
+        template = cv2.imread(template_path)
+        if template is None:
+            raise FileNotFoundError(
+                f"Template image not found or unreadable: {template_path}"
+            )
+        gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+        cached = (gray, cv2.pyrDown(gray))
+        _template_cache[template_path] = cached
+    return cached
+
+
+def _match_result_buf(shape: tuple[int, int]) -> np.ndarray:
+    """Return a reusable float32 score buffer of the given shape."""
+    buf = _match_result_cache.get(shape)
+    if buf is None:
+        buf = np.empty(shape, dtype=np.float32)
+        _match_result_cache[shape] = buf
+    return buf
+
 
 def game_click(x: int, y: int) -> None:
     """Click at game-relative coordinates, offset by the window position.
 
     Calls ``find_game_window()`` to determine the current window offset,
     then issues a ``pyautogui.click`` at the absolute screen position.
+    The implicit post-call pause is disabled (``_pause=False``) — every
+    click is followed by a ``wait_for_screen()`` or ``wait_for_stability()``
+    poll, which is the settling mechanism; the extra ``pyautogui.PAUSE``
+    sleep on top of that is dead time.
 
     Args:
         x: Horizontal position relative to the game client area.
@@ -72,7 +125,7 @@ def game_click(x: int, y: int) -> None:
     abs_x = x + geometry["left"]
     abs_y = y + geometry["top"]
     logger.debug("game_click(%d, %d) → absolute (%d, %d)", x, y, abs_x, abs_y)
-    pyautogui.click(abs_x, abs_y)
+    pyautogui.click(abs_x, abs_y, _pause=False)
 
 
 def game_move_to(x: int, y: int) -> None:
@@ -80,6 +133,7 @@ def game_move_to(x: int, y: int) -> None:
 
     Calls ``find_game_window()`` to determine the current window offset,
     then issues a ``pyautogui.moveTo`` at the absolute screen position.
+    The implicit post-call pause is disabled, as in ``game_click()``.
 
     Args:
         x: Horizontal position relative to the game client area.
@@ -89,24 +143,58 @@ def game_move_to(x: int, y: int) -> None:
     abs_x = x + geometry["left"]
     abs_y = y + geometry["top"]
     logger.debug("game_move_to(%d, %d) → absolute (%d, %d)", x, y, abs_x, abs_y)
-    pyautogui.moveTo(abs_x, abs_y)
+    pyautogui.moveTo(abs_x, abs_y, _pause=False)
+
+
+def game_scroll(x: int, y: int, clicks: int) -> None:
+    """Move to game-relative coordinates and scroll there as one gesture.
+
+    Issues both pyautogui calls with the implicit inter-call pause disabled
+    (``_pause=False``), so a scroll step costs one gesture instead of two
+    calls padded by ``pyautogui.PAUSE`` each.
+
+    Args:
+        x: Horizontal position relative to the game client area.
+        y: Vertical position relative to the game client area.
+        clicks: Scroll amount; negative scrolls down.
+    """
+    geometry = find_game_window()
+    abs_x = x + geometry["left"]
+    abs_y = y + geometry["top"]
+    logger.debug(
+        "game_scroll(%d, %d, %d) → absolute (%d, %d)", x, y, clicks, abs_x, abs_y
+    )
+    pyautogui.moveTo(abs_x, abs_y, _pause=False)
+    pyautogui.scroll(clicks, _pause=False)
 
 
 def wait_for_screen(
     template_path: str,
     timeout: float = 10.0,
     confidence: float = 0.85,
+    roi: "tuple[int, int, int, int] | None" = None,
 ) -> None:
     """Poll until a template image is found on screen.
 
     Captures the game window repeatedly and runs ``cv2.matchTemplate``
     against the provided template until the match score meets or exceeds
-    *confidence*, or *timeout* seconds elapse.
+    *confidence*, or *timeout* seconds elapse. Templates are decoded once
+    and cached; the score map is written into a reused buffer.
+
+    Matching is coarse-to-fine: each poll first matches at half resolution
+    with the threshold loosened by ``COARSE_CONFIDENCE_MARGIN``, and only
+    runs the full-resolution confirmation when the coarse pass scores high
+    enough. Negative polls — the common case while a screen transition is
+    in flight — pay roughly a quarter of the full match cost.
 
     Args:
         template_path: Path to the reference PNG template (1920x1080 crop).
         timeout: Maximum seconds to wait before raising.
         confidence: Minimum ``TM_CCOEFF_NORMED`` score to accept.
+        roi: ``(x, y, w, h)`` region of the screenshot to search. Defaults
+            to the template's entry in ``TEMPLATE_ROIS`` (full frame for
+            unknown templates) — the dict in ``config.py`` is the single
+            source of truth for per-template regions.
 
     Raises:
         FileNotFoundError: If the template image cannot be loaded.
@@ -114,19 +202,44 @@ def wait_for_screen(
             This is fatal and triggers an abort with a debug screenshot.
     """
     start = time.time()
-    template = cv2.imread(template_path)
-    if template is None:
-        raise FileNotFoundError(
-            f"Template image not found or unreadable: {template_path}"
-        )
+    template, template_half = _load_template(template_path)
+    t_h, t_w = template.shape[0], template.shape[1]
+    coarse_confidence = confidence - COARSE_CONFIDENCE_MARGIN
+    if roi is None:
+        roi = TEMPLATE_ROIS.get(Path(template_path).name)
     while time.time() - start < timeout:
-        screenshot = capture_window()
-        result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
-        if result.max() >= confidence:
-            logger.debug(
-                "Template '%s' matched (score=%.3f)", template_path, result.max()
+        # Shared capture buffer — the frame is never retained past this
+        # iteration, so skip the per-poll copy.
+        screenshot = capture_window(copy=False)
+        if roi is not None:
+            roi_x, roi_y, roi_w, roi_h = roi
+            screenshot = screenshot[roi_y:roi_y + roi_h, roi_x:roi_x + roi_w]
+        gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+        small = cv2.pyrDown(gray)
+        coarse_buf = _match_result_buf(
+            (
+                small.shape[0] - template_half.shape[0] + 1,
+                small.shape[1] - template_half.shape[1] + 1,
             )
-            return
+        )
+        coarse = cv2.matchTemplate(
+            small, template_half, cv2.TM_CCOEFF_NORMED, coarse_buf
+        )
+        if coarse.max() >= coarse_confidence:
+            buf = _match_result_buf(
+                (gray.shape[0] - t_h + 1, gray.shape[1] - t_w + 1)
+            )
+            result = cv2.matchTemplate(
+                gray, template, cv2.TM_CCOEFF_NORMED, buf
+            )
+            # Reduce the score map once — result.max() walks the full
+            # float32 map, so reuse the value for both the check and the log.
+            score = result.max()
+            if score >= confidence:
+                logger.debug(
+                    "Template '%s' matched (score=%.3f)", template_path, score
+                )
+                return
         time.sleep(POLL_INTERVAL)
     raise TimeoutError(f"Template '{template_path}' not found within {timeout}s")
 
@@ -134,33 +247,41 @@ def wait_for_screen(
 def wait_for_stability(timeout: float = FRAME_STABILITY_TIMEOUT) -> np.ndarray:
     """Wait until two consecutive captured frames are nearly identical.
 
-    Compares successive ``capture_window()`` frames via ``cv2.absdiff``.
-    Returns the stable frame once the mean pixel difference drops below
+    Compares successive ``capture_window()`` frames on a
+    ``STABILITY_SAMPLE_STRIDE``-strided sub-sample via ``cv2.norm`` with
+    ``NORM_L1`` — the same mean absolute difference as a full-frame
+    ``cv2.absdiff().mean()`` without materializing the difference image.
+    Returns the stable frame once the mean drops below
     ``STABILITY_THRESHOLD``.
 
     Args:
         timeout: Maximum seconds to wait before raising.
 
     Returns:
-        The stable BGR frame as a numpy array.
+        The stable BGR frame as a numpy array the caller owns.
 
     Raises:
         TimeoutError: If frame stability is not reached within *timeout*.
     """
     start = time.time()
-    prev = capture_window()
+    stride = STABILITY_SAMPLE_STRIDE
+    # Poll against the shared capture buffer and keep only the small strided
+    # sample between iterations; a full-frame copy is made once, for the
+    # stable frame handed to the caller.
+    prev_sample = capture_window(copy=False)[::stride, ::stride].copy()
     while time.time() - start < timeout:
         time.sleep(POLL_INTERVAL)
-        curr = capture_window()
-        diff = cv2.absdiff(prev, curr).mean()
+        curr = capture_window(copy=False)
+        curr_sample = curr[::stride, ::stride]
+        diff = cv2.norm(prev_sample, curr_sample, cv2.NORM_L1) / curr_sample.size
         if diff < STABILITY_THRESHOLD:
             logger.debug(
                 "Frame stable (diff=%.3f, threshold=%.1f)",
                 diff, STABILITY_THRESHOLD,
             )
-            return curr
+            return curr.copy()
         logger.debug("Frame unstable (diff=%.3f), waiting...", diff)
-        prev = curr
+        prev_sample = curr_sample.copy()
     raise TimeoutError(
         f"Frame stability not reached within {timeout}s "
         f"(threshold={STABILITY_THRESHOLD})"
@@ -178,7 +299,7 @@ def navigate_home() -> None:
         TimeoutError: If the World screen template is not found after
             navigation.
     """
-    template = str(TEMPLATE_DIR / TEMPLATE_WORLD_SCREEN)
+    template = TEMPLATE_PATHS[TEMPLATE_WORLD_SCREEN]
     for attempt in range(NAV_HOME_MAX_CLICKS):
         try:
             wait_for_screen(template, timeout=NAV_HOME_CHECK_TIMEOUT)
@@ -206,9 +327,9 @@ def navigate_to_guild_members() -> None:
     """
     logger.info("Navigating to Guild member list")
     game_click(*CLICK_GUILD)
-    wait_for_screen(str(TEMPLATE_DIR / TEMPLATE_GUILD_HALL))
+    wait_for_screen(TEMPLATE_PATHS[TEMPLATE_GUILD_HALL])
     game_click(*CLICK_GUILD_MENU)
-    wait_for_screen(str(TEMPLATE_DIR / TEMPLATE_GUILD_MEMBER_LIST))
+    wait_for_screen(TEMPLATE_PATHS[TEMPLATE_GUILD_MEMBER_LIST])
     logger.info("Arrived at Guild member list")
 
 
@@ -238,11 +359,11 @@ def _navigate_to_ranking(
     """
     logger.info("Navigating to %s ranking", mode_name)
     game_click(*CLICK_BATTLE_MODES)
-    wait_for_screen(str(TEMPLATE_DIR / TEMPLATE_BATTLE_MODES))
+    wait_for_screen(TEMPLATE_PATHS[TEMPLATE_BATTLE_MODES])
     game_click(*click_coords)
-    wait_for_screen(str(TEMPLATE_DIR / TEMPLATE_MODE_SCREEN))
+    wait_for_screen(TEMPLATE_PATHS[TEMPLATE_MODE_SCREEN])
     game_click(*ranking_click_coords)
-    wait_for_screen(str(TEMPLATE_DIR / TEMPLATE_RANKING_SCREEN))
+    wait_for_screen(TEMPLATE_PATHS[TEMPLATE_RANKING_SCREEN])
     apply_guild_filter(filter_1_coords, filter_2_coords)
     logger.info("Arrived at %s ranking with guild filter applied", mode_name)
 
@@ -341,7 +462,7 @@ def apply_guild_filter(
     game_click(*filter_1_coords)
     wait_for_stability()
     game_click(*filter_2_coords)
-    wait_for_screen(str(TEMPLATE_DIR / TEMPLATE_RANKING_SCREEN))
+    wait_for_screen(TEMPLATE_PATHS[TEMPLATE_RANKING_SCREEN])
     logger.debug("Guild filter applied")
 
 
@@ -356,6 +477,11 @@ def scroll_and_collect(
     *members*. Stops when 30 unique names are collected or a full scroll
     yields no new names.
 
+    OCR must be batched per frame: collect every detected card's field
+    crops from a stable frame into one list and make a single PaddleOCR
+    call, rather than one call per card — Paddle's per-call overhead
+    dominates at batch size 1.
+
     Args:
         mode: One of ``"activity"``, ``"afk_stages"``, ``"dream_realm"``,
             ``"supreme_arena"``, ``"arcane_labyrinth"``, ``"honor_duel"``.
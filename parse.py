@@ -8,7 +8,16 @@ guild member list. No navigation or export logic belongs here.
 import logging
 from typing import Optional
 
+import cv2
 import numpy as np
+from rapidfuzz import fuzz, process
+
+from config import (
+    CLEARED_HSV_LOWER,
+    CLEARED_HSV_UPPER,
+    CLEARED_PIXEL_THRESHOLD,
+    FUZZY_MATCH_THRESHOLD,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +61,27 @@ def parse_activity(raw_text: str) -> int:
     raise NotImplementedError
 
 
+def _is_cleared_by_color(card_region: np.ndarray) -> bool:
+    """Colour check for the green "Cleared" text on an AFK Stage card.
+
+    First pass of the two-pass Cleared detection. Converts only the cropped
+    card region to HSV and masks it in a single ``cv2.inRange`` pass —
+    no boolean intermediates — then counts mask pixels with
+    ``cv2.countNonZero``.
+
+    Args:
+        card_region: BGR crop of the stage region on the card.
+
+    Returns:
+        True if at least ``CLEARED_PIXEL_THRESHOLD`` pixels fall inside the
+        Cleared green HSV range. A False result is inconclusive — the
+        caller falls back to OCR.
+    """
+    hsv = cv2.cvtColor(card_region, cv2.COLOR_BGR2HSV)
+    mask = cv2.inRange(hsv, CLEARED_HSV_LOWER, CLEARED_HSV_UPPER)
+    return cv2.countNonZero(mask) >= CLEARED_PIXEL_THRESHOLD
+
+
 def parse_at_stage(card_image: np.ndarray) -> str:
     """Parse an AFK Stage value from a card image.
 
@@ -100,6 +130,8 @@ def match_player_name(
     """Fuzzy-match an OCR'd player name against the guild member list.
 
     Uses ``rapidfuzz`` with the threshold from ``config.FUZZY_MATCH_THRESHOLD``.
+    The whole comparison runs inside rapidfuzz's C++ scorer — the cutoff is
+    applied there too, so below-threshold candidates never surface to Python.
 
     Args:
         ocr_name: The name string returned by OCR.
@@ -110,7 +142,19 @@ def match_player_name(
         member name scores above the threshold. A ``None`` result is not
         an error — unmatched cards are expected (non-guild members).
     """
-    raise NotImplementedError
+    match = process.extractOne(
+        ocr_name,
+        members,
+        scorer=fuzz.ratio,
+        score_cutoff=FUZZY_MATCH_THRESHOLD * 100,
+    )
+    if match is None:
+        return None
+    canonical, score, _ = match
+    logger.debug(
+        "Matched OCR name '%s' -> '%s' (score=%.1f)", ocr_name, canonical, score
+    )
+    return canonical
 
 
 def detect_cards(screenshot: np.ndarray) -> list[int]:
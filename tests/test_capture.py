@@ -5,10 +5,23 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
+import capture
 from capture import capture_window, find_game_window, save_debug_screenshot
 from config import GAME_HEIGHT, GAME_WIDTH
 
 
+@pytest.fixture(autouse=True)
+def _reset_capture_state():
+    """Reset the shared mss instance and geometry cache between tests."""
+    capture._sct = None
+    capture._window_cache = None
+    capture._debug_dir_ready = False
+    yield
+    capture._sct = None
+    capture._window_cache = None
+    capture._debug_dir_ready = False
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -125,6 +138,42 @@ class TestFindGameWindowLinux:
             find_game_window()
 
 
+# ---------------------------------------------------------------------------
+# find_game_window — geometry caching
+# ---------------------------------------------------------------------------
+
+class TestFindGameWindowCache:
+    """Tests for find_game_window() geometry caching."""
+
+    @patch("capture.subprocess.run")
+    @patch("capture.platform.system", return_value="Linux")
+    def test_second_call_within_ttl_skips_enumeration(
+        self, _mock_system: MagicMock, mock_run: MagicMock,
+    ) -> None:
+        """A repeat call inside the TTL reuses the cached geometry."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="1234\n")
+
+        first = find_game_window()
+        second = find_game_window()
+
+        assert first == second
+        mock_run.assert_called_once()
+
+    @patch("capture.subprocess.run")
+    @patch("capture.platform.system", return_value="Linux")
+    def test_invalidation_forces_re_enumeration(
+        self, _mock_system: MagicMock, mock_run: MagicMock,
+    ) -> None:
+        """After invalidation, the next call re-resolves the window."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="1234\n")
+
+        find_game_window()
+        capture._invalidate_window_cache()
+        find_game_window()
+
+        assert mock_run.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # capture_window
 # ---------------------------------------------------------------------------
@@ -141,8 +190,7 @@ class TestCaptureWindow:
         mock_find.return_value = _mock_window_rect()
         mock_sct = MagicMock()
         mock_sct.grab.return_value = _fake_bgra_frame()
-        mock_mss_cls.return_value.__enter__ = MagicMock(return_value=mock_sct)
-        mock_mss_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_mss_cls.return_value = mock_sct
 
         frame = capture_window()
 
@@ -161,8 +209,7 @@ class TestCaptureWindow:
         bgra[:, :, 3] = 255
         mock_sct = MagicMock()
         mock_sct.grab.return_value = bgra
-        mock_mss_cls.return_value.__enter__ = MagicMock(return_value=mock_sct)
-        mock_mss_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_mss_cls.return_value = mock_sct
 
         frame = capture_window()
 
@@ -189,8 +236,7 @@ class TestCaptureWindow:
         wrong_frame = np.zeros((720, 1280, 4), dtype=np.uint8)
         mock_sct = MagicMock()
         mock_sct.grab.return_value = wrong_frame
-        mock_mss_cls.return_value.__enter__ = MagicMock(return_value=mock_sct)
-        mock_mss_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_mss_cls.return_value = mock_sct
 
         with pytest.raises(RuntimeError, match="Unexpected capture dimensions"):
             capture_window()
@@ -205,8 +251,7 @@ class TestCaptureWindow:
         mock_find.return_value = geom
         mock_sct = MagicMock()
         mock_sct.grab.return_value = _fake_bgra_frame()
-        mock_mss_cls.return_value.__enter__ = MagicMock(return_value=mock_sct)
-        mock_mss_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_mss_cls.return_value = mock_sct
 
         capture_window()
 
@@ -282,8 +327,7 @@ class TestSaveDebugScreenshot:
             {"left": 0, "top": 0, "width": 1920, "height": 1080},  # primary
         ]
         mock_sct.grab.return_value = np.zeros((1080, 1920, 4), dtype=np.uint8)
-        mock_mss_cls.return_value.__enter__ = MagicMock(return_value=mock_sct)
-        mock_mss_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_mss_cls.return_value = mock_sct
 
         mock_imwrite.return_value = True
 
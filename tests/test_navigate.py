@@ -42,6 +42,18 @@ from config import (
     TEMPLATE_WORLD_SCREEN,
 )
 
+import navigate
+
+
+@pytest.fixture(autouse=True)
+def _reset_navigate_caches():
+    """Clear the template and result-buffer caches between tests."""
+    navigate._template_cache.clear()
+    navigate._match_result_cache.clear()
+    yield
+    navigate._template_cache.clear()
+    navigate._match_result_cache.clear()
+
 
 # ---------------------------------------------------------------------------
 # TestGameClick
@@ -59,7 +71,7 @@ class TestGameClick:
         from navigate import game_click
         game_click(500, 300)
 
-        mock_click.assert_called_once_with(700, 400)
+        mock_click.assert_called_once_with(700, 400, _pause=False)
 
     @patch("navigate.pyautogui.click")
     @patch("navigate.find_game_window")
@@ -70,7 +82,7 @@ class TestGameClick:
         from navigate import game_click
         game_click(960, 540)
 
-        mock_click.assert_called_once_with(960, 540)
+        mock_click.assert_called_once_with(960, 540, _pause=False)
 
 
 # ---------------------------------------------------------------------------
@@ -89,7 +101,7 @@ class TestGameMoveTo:
         from navigate import game_move_to
         game_move_to(960, 540)
 
-        mock_move.assert_called_once_with(1160, 640)
+        mock_move.assert_called_once_with(1160, 640, _pause=False)
 
     @patch("navigate.pyautogui.moveTo")
     @patch("navigate.find_game_window")
@@ -100,7 +112,30 @@ class TestGameMoveTo:
         from navigate import game_move_to
         game_move_to(100, 200)
 
-        mock_move.assert_called_once_with(100, 200)
+        mock_move.assert_called_once_with(100, 200, _pause=False)
+
+
+# ---------------------------------------------------------------------------
+# TestGameScroll
+# ---------------------------------------------------------------------------
+
+class TestGameScroll:
+    """Tests for game_scroll() batched move+scroll helper."""
+
+    @patch("navigate.pyautogui.scroll")
+    @patch("navigate.pyautogui.moveTo")
+    @patch("navigate.find_game_window")
+    def test_offsets_move_and_scrolls_without_pause(
+        self, mock_find, mock_move, mock_scroll
+    ):
+        """Should offset the move by window position and disable the pause."""
+        mock_find.return_value = {"left": 200, "top": 100, "width": 1920, "height": 1080}
+
+        from navigate import game_scroll
+        game_scroll(960, 540, -300)
+
+        mock_move.assert_called_once_with(1160, 640, _pause=False)
+        mock_scroll.assert_called_once_with(-300, _pause=False)
 
 
 # ---------------------------------------------------------------------------
@@ -151,7 +186,11 @@ class TestWaitForScreen:
         fail_result.max.return_value = 0.5
         pass_result = MagicMock()
         pass_result.max.return_value = 0.90
-        mock_match.side_effect = [fail_result, fail_result, pass_result]
+        # Two failed coarse passes, then a passing coarse pass followed by
+        # the full-resolution confirmation.
+        mock_match.side_effect = [
+            fail_result, fail_result, pass_result, pass_result,
+        ]
 
         from navigate import wait_for_screen
         wait_for_screen("template.png", timeout=10.0)
@@ -242,8 +281,10 @@ class TestWaitForScreen:
         from navigate import wait_for_screen
         wait_for_screen("template.png")
 
-        mock_match.assert_called_once()
-        assert mock_match.call_args[0][2] == cv2.TM_CCOEFF_NORMED
+        # Coarse pass plus full-resolution confirmation, both TM_CCOEFF_NORMED.
+        assert mock_match.call_count == 2
+        for match_call in mock_match.call_args_list:
+            assert match_call[0][2] == cv2.TM_CCOEFF_NORMED
 
 
 # ---------------------------------------------------------------------------
@@ -328,7 +369,8 @@ class TestWaitForStability:
         from navigate import wait_for_stability
         result = wait_for_stability()
 
-        assert result is frame_b
+        # The returned frame is an owned copy of the stable capture.
+        assert np.array_equal(result, frame_b)
 
 
 # ---------------------------------------------------------------------------
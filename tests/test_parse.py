@@ -1 +1,65 @@
 """Tests for parse.py — OCR, parsing, and name matching."""
+
+import cv2
+import numpy as np
+
+from config import CLEARED_PIXEL_THRESHOLD
+from parse import _is_cleared_by_color, match_player_name
+
+
+def _bgr_patch(hsv: tuple[int, int, int], size: int = 40) -> np.ndarray:
+    """Create a solid BGR patch from an HSV colour (synthetic card region)."""
+    hsv_img = np.full((size, size, 3), hsv, dtype=np.uint8)
+    return cv2.cvtColor(hsv_img, cv2.COLOR_HSV2BGR)
+
+
+class TestIsClearedByColor:
+    """Tests for the _is_cleared_by_color() HSV check."""
+
+    def test_cleared_green_region_detected(self):
+        """A region filled with Cleared green (HSV 45,60,200) passes."""
+        assert _is_cleared_by_color(_bgr_patch((45, 60, 200))) is True
+
+    def test_non_green_region_not_detected(self):
+        """A grey region (HSV 0,0,128) has no Cleared pixels."""
+        assert _is_cleared_by_color(_bgr_patch((0, 0, 128))) is False
+
+    def test_too_few_green_pixels_is_inconclusive(self):
+        """Green pixel counts below CLEARED_PIXEL_THRESHOLD do not pass."""
+        region = _bgr_patch((0, 0, 128))
+        green = _bgr_patch((45, 60, 200))
+        # Paint fewer green pixels than the threshold requires.
+        n = CLEARED_PIXEL_THRESHOLD - 1
+        region.reshape(-1, 3)[:n] = green.reshape(-1, 3)[:n]
+        assert _is_cleared_by_color(region) is False
+
+MEMBERS = ["Shadowbane", "Luna", "小龙女", "xXDragonXx", "Mirabelle"]
+
+
+class TestMatchPlayerName:
+    """Tests for match_player_name() fuzzy matching."""
+
+    def test_exact_match_returns_canonical_name(self):
+        """An exact OCR read should return the canonical spelling."""
+        assert match_player_name("Shadowbane", MEMBERS) == "Shadowbane"
+
+    def test_near_miss_ocr_error_matches(self):
+        """A one-character OCR slip should still match above threshold."""
+        assert match_player_name("Shadowbame", MEMBERS) == "Shadowbane"
+
+    def test_cjk_name_matches(self):
+        """CJK member names should match exactly."""
+        assert match_player_name("小龙女", MEMBERS) == "小龙女"
+
+    def test_non_member_returns_none(self):
+        """A name unrelated to any member should return None."""
+        assert match_player_name("TotallyDifferent", MEMBERS) is None
+
+    def test_below_threshold_returns_none(self):
+        """A weak partial similarity below the threshold should not match."""
+        # "Lunatic" vs "Luna": ratio ~0.73, below the 0.85 threshold.
+        assert match_player_name("Lunatic", MEMBERS) is None
+
+    def test_empty_ocr_name_returns_none(self):
+        """An empty OCR result should never match a member."""
+        assert match_player_name("", MEMBERS) is None